@@ -23,7 +23,17 @@
 from confspec.loader import *
 from confspec.parsers import *
 
-__all__ = ["JsonParser", "Parser", "TomlParser", "YamlParser", "load", "loads", "parser_registry"]
+__all__ = [
+    "JsonParser",
+    "LazyConfig",
+    "Parser",
+    "TomlParser",
+    "YamlParser",
+    "load",
+    "load_many",
+    "loads",
+    "parser_registry",
+]
 
 # Do not change the below field manually. It is updated by CI upon release.
 __version__ = "0.0.5"
@@ -22,53 +22,53 @@ from __future__ import annotations
 
 __all__ = ["env_file_name", "is_msgspec", "is_pydantic"]
 
-import contextlib
+import functools
 import os
 import typing as t
 
 if t.TYPE_CHECKING:
-    import pathlib
-    from collections.abc import Generator
-
     import msgspec
     import pydantic
     import typing_extensions as t_ex
 
 
-def env_file_name(path: pathlib.Path, env: str) -> str:
-    base = path.name[: path.name.find(".") or len(path.name)]
-    return f"{base}.{env}{''.join(path.suffixes)}"
+def env_file_name(path: str | os.PathLike[str], env: str) -> str:
+    name = os.path.basename(path)
+    base = name[: name.find(".") or len(name)]
 
+    # equivalent to ''.join(pathlib.PurePath(name).suffixes)
+    stripped = name.lstrip(".")
+    idx = stripped.find(".")
+    suffixes = "" if name.endswith(".") or idx == -1 else stripped[idx:]
 
-def is_msgspec(cls: t.Any) -> t_ex.TypeGuard[type[msgspec.Struct]]:
+    return f"{base}.{env}{suffixes}"
+
+
+@functools.lru_cache(maxsize=256)
+def _classify(cls: t.Any) -> t.Literal["pydantic", "msgspec", "unknown"]:
+    # the same classes are passed repeatedly, so the imports and subclass checks only need to happen once per class
     try:
-        import msgspec
+        import pydantic
 
-        return issubclass(cls, msgspec.Struct)
+        if issubclass(cls, pydantic.BaseModel):
+            return "pydantic"
     except ImportError:
-        return False
-
+        pass
 
-def is_pydantic(cls: t.Any) -> t_ex.TypeGuard[type[pydantic.BaseModel]]:
     try:
-        import pydantic
+        import msgspec
 
-        return issubclass(cls, pydantic.BaseModel)
+        if issubclass(cls, msgspec.Struct):
+            return "msgspec"
     except ImportError:
-        return False
+        pass
 
+    return "unknown"
 
-@contextlib.contextmanager
-def temp_set_env(key: str, value: str | None) -> Generator[None, t.Any, t.Any]:
-    old_value = os.getenv(key, None)
 
-    if value is not None:
-        os.environ[key] = value
+def is_msgspec(cls: t.Any) -> t_ex.TypeGuard[type[msgspec.Struct]]:
+    return _classify(cls) == "msgspec"
 
-    try:
-        yield
-    finally:
-        if old_value is not None:
-            os.environ[key] = old_value
-        else:
-            os.environ.pop(key, None)
+
+def is_pydantic(cls: t.Any) -> t_ex.TypeGuard[type[pydantic.BaseModel]]:
+    return _classify(cls) == "pydantic"
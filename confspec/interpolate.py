@@ -22,31 +22,38 @@ from __future__ import annotations
 
 __all__ = ["InterpolationVisitor", "try_interpolate"]
 
+import collections
 import os
 import re
 import typing as t
 
-_escaped = r"(?P<escaped>\$)"
-_name = r"(?P<name>[a-zA-Z_]\w*)"
-_delim = r"(?P<delim>[^]}]+)"
-_strip = r"(?P<strip>~)"
-_default = r"(?P<default>:[^}]*|\?)"
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Mapping
 
-INTERPOLATION_PATTERN: t.Final[re.Pattern[str]] = re.compile(
-    rf"{_escaped}?(?P<raw>\${{{_name}(?:\[{_delim}])?{_strip}?{_default}?}})"
-)
+# Positional groups are used (rather than named groups) so that matches can be unpacked with a single
+# call to 'Match.groups()' - the groups are, in order: name, delim, strip, default
+_name = r"([a-zA-Z_]\w*)"
+_delim = r"([^]}]+)"
+_strip = r"(~)"
+_default = r"(:[^}]*|\?)"
 
+_MISSING: t.Final[t.Any] = object()
+_environ_get = t.cast("Callable[[str, t.Any], t.Any]", os.environ.get)
 
-def _replace_fn(match: re.Match[str]) -> str:
-    if match.group("escaped"):
-        return str(match.group("raw"))
+# Matches a single expression - candidate positions (and escapes) are found by 'try_interpolate' using plain
+# string searching, and the pattern is then only applied, anchored, at each of those positions
+INTERPOLATION_PATTERN: t.Final[re.Pattern[str]] = re.compile(rf"\${{{_name}(?:\[{_delim}])?{_strip}?{_default}?}}")
 
-    if match.group("delim") is not None:
+
+def _replace_fn(match: re.Match[str], env_get: Callable[[str, t.Any], t.Any] = _environ_get) -> str:
+    name, delim, strip, default = match.groups()
+    if delim is not None:
         raise SyntaxError("list expansion is not supported within strings")
 
-    var, is_set = os.getenv(name := match.group("name")), name in os.environ
-    if not is_set:
-        if (default := match.group("default")) is None:
+    if (var := env_get(name, _MISSING)) is _MISSING:
+        if default is None:
             raise KeyError(f"environment variable '{name}' is not set and no default was specified")
 
         if default == "?":
@@ -56,50 +63,112 @@ def _replace_fn(match: re.Match[str]) -> str:
     else:
         resolved = str(var)
 
-    return resolved.strip() if match.group("strip") is not None else resolved
+    return resolved.strip() if strip is not None else resolved
+
+
+def try_interpolate(value: str, env: Mapping[str, str] | None = None) -> t.Any:
+    # the vast majority of values contain no substitutions, so avoid entering the regex engine entirely
+    if (idx := value.find("${")) == -1:
+        return value
 
+    env_get = _environ_get if env is None else t.cast("Callable[[str, t.Any], t.Any]", env.get)
 
-def try_interpolate(value: str) -> t.Any:
-    match = INTERPOLATION_PATTERN.fullmatch(value)
-    matched_and_not_escaped = match is not None and match.group("escaped") is None
+    if idx == 0 and value[-1] == "}" and "}" not in (inner := value[2:-1]):
+        # fast path for the common '${NAME}' and '${NAME:default}' forms which can be resolved
+        # using plain string operations - anything using the other flags falls through to the regex
+        name, colon, default = inner.partition(":")
+        if name.isascii() and name.isidentifier():
+            if (var := env_get(name, _MISSING)) is not _MISSING:
+                return var
+            if colon:
+                return default
+            raise KeyError(f"environment variable '{name}' is not set and no default was specified")
+
+    match_at = INTERPOLATION_PATTERN.match
+    if idx == 0 and (match := match_at(value)) is not None and match.end() == len(value):
+        # the value is a single expression so may resolve to something other than a string
+        name, delim, strip, default = match.groups()
+        if delim is None and default != "?":
+            return _replace_fn(match, env_get)
 
-    if matched_and_not_escaped:
-        assert match is not None
+        val: str = env_get(name, _MISSING)
         # If the "?" (None as default) flag is present, and the variable is unset
         # then return None
-        if match.group("default") == "?" and os.getenv(match.group("name")) is None:
+        if val is _MISSING and default == "?":
             return None
 
         # if a delimiter was specified, split into list - otherwise use the standard substitution function
-        if (delim := match.group("delim")) is not None:
-            strip = match.group("strip") is not None
-            val = os.getenv(match.group("name"), (match.group("default") or "")[1:])
-            return [(elem.strip() if strip else elem) for elem in val.split(delim)]
+        if delim is not None:
+            if val is _MISSING:
+                val = (default or "")[1:]
+            return [(elem.strip() if strip is not None else elem) for elem in val.split(delim)]
+
+        return _replace_fn(match, env_get)
 
-    return INTERPOLATION_PATTERN.sub(_replace_fn, value)
+    chunks: list[str] = []
+    pos = 0
+    while idx != -1:
+        if (match := match_at(value, idx)) is None:
+            idx = value.find("${", idx + 1)
+            continue
+
+        if idx > pos and value[idx - 1] == "$":
+            # escaped - drop the escaping '$' and leave the rest of the expression untouched
+            chunks.append(value[pos : idx - 1])
+            chunks.append(match.group(0))
+        else:
+            chunks.append(value[pos:idx])
+            chunks.append(_replace_fn(match, env_get))
+
+        pos = match.end()
+        idx = value.find("${", pos)
+
+    chunks.append(value[pos:])
+    return "".join(chunks)
 
 
 class InterpolationVisitor:
-    __slots__ = ()
+    __slots__ = ("_cache", "_env")
+
+    def __init__(self, env: Mapping[str, str] | None = None) -> None:
+        self._env = env
+        # configs often repeat the same expression many times - the environment cannot change during
+        # a single visit so results can be reused for every occurrence
+        self._cache: dict[str, t.Any] = {}
 
     def visit_value(self, val: t.Any) -> t.Any:
-        if not isinstance(val, str):
+        if not isinstance(val, str) or "${" not in val:
             return val
-        return try_interpolate(val)
-
-    def visit_list(self, lst: list[t.Any]) -> list[t.Any]:
-        for i in range(len(lst)):
-            lst[i] = self.visit(lst[i])
-        return lst
 
-    def visit_dict(self, dct: dict[str, t.Any]) -> dict[str, t.Any]:
-        for k, v in list(dct.items()):
-            dct[k] = self.visit(v)
-        return dct
+        if (resolved := self._cache.get(val, _MISSING)) is _MISSING:
+            if self._env is None:
+                # lookups on os.environ re-encode the key each time, so take a plain dict snapshot on first use.
+                # this also means that concurrent modification of the environment cannot affect a visit
+                self._env = dict(os.environ)
+            resolved = self._cache[val] = try_interpolate(val, self._env)
+        # lists are mutable, so each occurrence must receive its own copy
+        return list(t.cast("list[t.Any]", resolved)) if isinstance(resolved, list) else resolved
 
     def visit(self, item: t.Any) -> t.Any:
-        if isinstance(item, dict):
-            return self.visit_dict(t.cast("dict[str, t.Any]", item))
-        elif isinstance(item, list):
-            return self.visit_list(t.cast("list[t.Any]", item))
-        return self.visit_value(item)
+        if not isinstance(item, (dict, list)):
+            return self.visit_value(item)
+
+        # walk the tree iteratively with an explicit stack - values are replaced in place, and keys are
+        # never added or removed, so it is safe to iterate over the containers directly without copying them
+        visit_value, dict_, list_, str_ = self.visit_value, dict, list, str
+        stack: collections.deque[t.Any] = collections.deque([item])
+        while stack:
+            container = stack.pop()
+            items = t.cast(
+                "Iterable[tuple[t.Any, t.Any]]",
+                container.items() if isinstance(container, dict_) else enumerate(container),
+            )
+
+            for key, value in items:
+                if isinstance(value, str_):
+                    if "${" in value:
+                        container[key] = visit_value(value)
+                elif isinstance(value, (dict_, list_)):
+                    stack.append(value)
+
+        return t.cast("t.Any", item)
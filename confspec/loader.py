@@ -20,13 +20,17 @@
 # SOFTWARE.
 from __future__ import annotations
 
-__all__ = ["load", "loads", "parser_registry"]
+__all__ = ["LazyConfig", "load", "load_many", "loads", "parser_registry"]
 
+import codecs
+import concurrent.futures
+import contextlib
 import functools
-import json
 import os
 import pathlib
 import typing as t
+from collections.abc import Iterable
+from collections.abc import Mapping
 from collections.abc import Sequence
 
 from confspec import helpers
@@ -35,6 +39,7 @@ from confspec import parsers
 
 if t.TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterator
 
     import msgspec
     import pydantic
@@ -51,25 +56,123 @@ parser_registry: dict[str, type[parsers.Parser]] = {
 }
 """Dictionary mapping file extension to parser class used when parsing data of that format."""
 
+_READ_CHUNK_SIZE: t.Final[int] = 64 * 1024
+
+_BUILTIN_PARSERS: t.Final[frozenset[type[parsers.Parser]]] = frozenset(
+    {parsers.CachingYamlParser, parsers.JsonParser, parsers.TomlParser, parsers.YamlParser}
+)
+
+_MISSING: t.Final[t.Any] = object()
+
+_parser_instances: dict[type[parsers.Parser], parsers.Parser] = {}
+
 KnownFormats: t.TypeAlias = t.Literal["json", "toml", "yaml", "yml"]
 
 
 class ContentAndFormat(t.NamedTuple):
-    content: str | bytes
+    content: bytes
     format: str
 
 
-def _merge_dicts(d1: dict[str, t.Any], d2: dict[str, t.Any]) -> dict[str, t.Any]:
-    for key in d2:
-        if key in d1 and isinstance(d1[key], dict) and isinstance(d2[key], dict):
-            _merge_dicts(d1[key], d2[key])
-            continue
+def _get_parser(fmt: str) -> parsers.Parser:
+    parser_cls = parser_registry.get(fmt)
+    if parser_cls is None:
+        raise NotImplementedError(f"no parser registered for format {fmt!r}")
+
+    # parsers hold no state, so a single instance of each parser class can be shared between all reads.
+    # instances are keyed by class rather than format as the registry may be modified at any time
+    if (parser := _parser_instances.get(parser_cls)) is None:
+        parser = _parser_instances[parser_cls] = parser_cls()
+    return parser
 
-        d1[key] = d2[key]
+
+def _merge_dicts(d1: dict[str, t.Any], d2: dict[str, t.Any]) -> dict[str, t.Any]:
+    # merge iteratively using an explicit stack of (destination, source) pairs to avoid recursion overhead
+    dict_ = dict
+    stack: list[tuple[dict[str, t.Any], dict[str, t.Any]]] = [(d1, d2)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(existing := dst.get(key), dict_) and isinstance(value, dict_):
+                stack.append((t.cast("dict[str, t.Any]", existing), t.cast("dict[str, t.Any]", value)))
+                continue
+
+            dst[key] = value
 
     return d1
 
 
+@functools.cache
+def _json_encoder() -> Callable[[t.Any], bytes]:
+    try:
+        import msgspec
+
+        return msgspec.json.encode
+    except ImportError:
+        import json
+
+        return lambda obj: json.dumps(obj).encode()
+
+
+def _new_msgspec_json_decoder(
+    cls: type[msgspec.Struct], strict: bool, dec_hook: Callable[[type[t.Any], t.Any], t.Any] | None
+) -> msgspec.json.Decoder[msgspec.Struct]:
+    import msgspec
+
+    return msgspec.json.Decoder(cls, strict=strict, dec_hook=dec_hook)
+
+
+# decoders are intended to be reused - creating one per call repeats the work of processing the type
+_cached_msgspec_json_decoder = functools.lru_cache(maxsize=64)(_new_msgspec_json_decoder)
+
+
+def _msgspec_json_decoder(
+    cls: type[msgspec.Struct], strict: bool, dec_hook: Callable[[type[t.Any], t.Any], t.Any] | None
+) -> msgspec.json.Decoder[msgspec.Struct]:
+    if dec_hook is not None:
+        try:
+            hash(dec_hook)
+        except TypeError:
+            # any callable can be used as a hook, but only hashable ones can be used as part of the cache key
+            return _new_msgspec_json_decoder(cls, strict, dec_hook)
+
+    return _cached_msgspec_json_decoder(cls, strict, dec_hook)
+
+
+@functools.cache
+def _msgspec_convert() -> Callable[..., t.Any]:
+    import msgspec
+
+    return msgspec.convert
+
+
+def _has_non_str_keys(obj: t.Any) -> bool:
+    stack: list[t.Any] = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for key, value in t.cast("dict[t.Any, t.Any]", item).items():
+                if type(key) is not str:
+                    return True
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(item, list):
+            stack.extend(t.cast("list[t.Any]", item))
+    return False
+
+
+_WIDE_BOMS = (codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+
+def _may_contain_expressions(raw: bytes) -> bool:
+    # the byte search only works for ASCII-compatible encodings - parsers such as ruamel.yaml also accept
+    # UTF-16 and UTF-32 documents when they start with a BOM
+    if raw.startswith(_WIDE_BOMS):
+        return True
+    # escape sequences could also be used to produce an expression once the document is parsed
+    return b"${" in raw or b"\\" in raw
+
+
 def _loads(
     hierarchy: Sequence[ContentAndFormat],
     /,
@@ -77,34 +180,136 @@ def _loads(
     cls: type[pydantic.BaseModel | msgspec.Struct] | None = None,
     strict: bool = False,
     dec_hook: Callable[[type[t.Any], t.Any], t.Any] | None = None,
+    environ: Mapping[str, str] | None = None,
 ) -> dict[str, t.Any] | pydantic.BaseModel | msgspec.Struct:
-    mappings: list[dict[str, t.Any]] = []
-    for item in hierarchy:
-        parser = parser_registry.get(item.format)
-        if parser is None:
-            raise NotImplementedError(f"no parser registered for format {item.format!r}")
-
-        content = item.content.encode() if isinstance(item.content, str) else item.content
-        mappings.append(parser().read(content))
+    if (
+        cls is not None
+        and len(hierarchy) == 1
+        and hierarchy[0].format == "json"
+        and parser_registry.get("json") is parsers.JsonParser
+    ):
+        content = hierarchy[0].content
+        if not _may_contain_expressions(content):
+            # there is nothing to merge or interpolate, so the raw document can be validated directly
+            if helpers.is_pydantic(cls):
+                return cls.model_validate_json(content, strict=strict)
+            elif helpers.is_msgspec(cls):
+                return _msgspec_json_decoder(cls, strict, dec_hook).decode(content)
 
-    parsed = functools.reduce(_merge_dicts, mappings)
-    interpolated = interpolate.InterpolationVisitor().visit(parsed)
+    mappings: list[dict[str, t.Any]] = []
+    needs_interpolation = False
+    for content, fmt in hierarchy:
+        parser = _get_parser(fmt)
+        mappings.append(parser.read(content))
+
+        # the built-in parsers can only produce an expression if one is present in the raw document, so a cheap
+        # substring search lets us skip walking the whole tree. custom parsers make no such guarantee
+        needs_interpolation = (
+            needs_interpolation or type(parser) not in _BUILTIN_PARSERS or _may_contain_expressions(content)
+        )
+
+    parsed = mappings[0]
+    for mapping in mappings[1:]:
+        _merge_dicts(parsed, mapping)
+
+    interpolated = interpolate.InterpolationVisitor(environ).visit(parsed) if needs_interpolation else parsed
     if cls is None:
         return interpolated
 
-    dumped = json.dumps(interpolated)
+    # formats such as YAML allow non-string keys, which are converted to strings by the JSON round-trip. they are
+    # rare enough that falling back to the round-trip is simpler than converting them in place
+    round_trip = _has_non_str_keys(interpolated)
+
     if helpers.is_pydantic(cls):
-        return cls.model_validate_json(dumped, strict=strict)
+        if strict or round_trip:
+            # in strict mode pydantic only accepts strings for types such as datetimes when validating JSON,
+            # so the round-trip is still required to keep the same behaviour
+            return cls.model_validate_json(_json_encoder()(interpolated), strict=strict)
+        # strict must be passed explicitly so that it overrides any strict setting in the model's config,
+        # in the same way as when validating JSON
+        return cls.model_validate(interpolated, strict=False)
     elif helpers.is_msgspec(cls):
-        import msgspec
-
-        return msgspec.json.decode(dumped, type=cls, strict=strict, dec_hook=dec_hook)
+        if round_trip:
+            return _msgspec_json_decoder(cls, strict, dec_hook).decode(_json_encoder()(interpolated))
+        # str_keys allows keys to be converted from strings in the same way as when decoding JSON
+        return _msgspec_convert()(interpolated, type=cls, strict=strict, dec_hook=dec_hook, str_keys=True)
 
     raise NotImplementedError(f"unknown class '{cls}' provided")
 
 
+class LazyConfig(Mapping[str, t.Any]):
+    """
+    Read-only mapping returned by :meth:`~loads` when ``lazy=True``. Environment variable substitution (and,
+    for JSON, decoding) is only performed for a top-level key when it is first accessed, so the parts of a large
+    configuration that are never used are never processed.
+
+    A key whose value references an unset environment variable (with no default) is still present in the
+    mapping - accessing it raises :obj:`ValueError` rather than :obj:`KeyError`, so that it cannot be mistaken for
+    a missing key.
+    """
+
+    __slots__ = ("_decode", "_items", "_resolved", "_visitor")
+
+    def __init__(
+        self,
+        items: dict[str, t.Any],
+        decode: Callable[[t.Any], t.Any] | None,
+        visitor: interpolate.InterpolationVisitor | None,
+    ) -> None:
+        self._items = items
+        self._decode = decode
+        self._visitor = visitor
+        self._resolved: dict[str, t.Any] = {}
+
+    def __getitem__(self, key: str) -> t.Any:
+        if (value := self._resolved.get(key, _MISSING)) is _MISSING:
+            value = self._items[key]
+            if self._decode is not None:
+                value = self._decode(value)
+            if self._visitor is not None:
+                try:
+                    value = self._visitor.visit(value)
+                except KeyError as e:
+                    # a KeyError would make Mapping.get and friends treat the key as absent
+                    raise ValueError(f"failed to interpolate value for key '{key}': {e.args[0]}") from e
+            self._resolved[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def _loads_lazy(raw: bytes, fmt: str) -> LazyConfig:
+    parser = _get_parser(fmt)
+    needs_interpolation = type(parser) not in _BUILTIN_PARSERS or _may_contain_expressions(raw)
+    visitor = interpolate.InterpolationVisitor() if needs_interpolation else None
+
+    if type(parser) is parsers.JsonParser:
+        try:
+            import msgspec
+        except ImportError:
+            pass
+        else:
+            # only split the document into its top-level keys - each value is decoded when it is first accessed
+            items = msgspec.json.decode(raw, type=dict[str, msgspec.Raw])
+            return LazyConfig(items, msgspec.json.decode, visitor)
+
+    # other formats cannot be partially parsed, but substitution can still be deferred
+    return LazyConfig(parser.read(raw), None, visitor)
+
+
+@t.overload
+def loads(raw: str | bytes, fmt: KnownFormats | str, /, *, lazy: t.Literal[False] = False) -> dict[str, t.Any]: ...
+@t.overload
+def loads(raw: str | bytes, fmt: KnownFormats | str, /, *, lazy: t.Literal[True]) -> LazyConfig: ...
 @t.overload
-def loads(raw: str | bytes, fmt: KnownFormats | str, /) -> dict[str, t.Any]: ...
+def loads(raw: str | bytes, fmt: KnownFormats | str, /, *, lazy: bool) -> dict[str, t.Any] | LazyConfig: ...
 @t.overload
 def loads(
     raw: str | bytes,
@@ -127,29 +332,64 @@ def loads(
     cls: type[pydantic.BaseModel | msgspec.Struct] | None = None,
     strict: bool = False,
     dec_hook: Callable[[type[t.Any], t.Any], t.Any] | None = None,
-) -> dict[str, t.Any] | pydantic.BaseModel | msgspec.Struct:
+    lazy: bool = False,
+) -> dict[str, t.Any] | LazyConfig | pydantic.BaseModel | msgspec.Struct:
     """
     Like :meth:`~load`, but loads the configuration from the given string or bytes object instead. You must
     pass a format when using this method so that the library knows which parser to use. All other arguments
     have the same meaning as in :meth:`~load`.
+
+    If ``lazy`` is :obj:`True`, a :obj:`~LazyConfig` is returned instead of a dictionary, which only processes
+    each top-level key when it is accessed. This cannot be combined with ``cls``.
     """
+    # content is handled as bytes internally (files are always read as bytes) so strings are encoded once here
+    raw = raw.encode() if isinstance(raw, str) else raw
+    if lazy:
+        if cls is not None:
+            raise ValueError("lazy loading is not supported when parsing to a class")
+        return _loads_lazy(raw, fmt)
+
     return _loads([ContentAndFormat(raw, fmt)], cls=cls, strict=strict, dec_hook=dec_hook)
 
 
+def _read_file(path: str) -> bytes:
+    if not hasattr(os, "posix_fadvise"):
+        # unbuffered, as the whole file is read at once the buffer would only add an extra copy
+        with open(path, "rb", buffering=0) as file:
+            return file.read()
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        # the whole file is always read front-to-back, so let the kernel read ahead as aggressively as it can.
+        # advice is only a hint, and is not supported for every type of file (e.g. pipes)
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+
+        data = os.read(fd, size)
+        # the reported size is not always accurate (e.g. the file is being written to) so read until EOF
+        rest: list[bytes] = []
+        while chunk := os.read(fd, _READ_CHUNK_SIZE):
+            rest.append(chunk)
+        return data + b"".join(rest) if rest else data
+    finally:
+        os.close(fd)
+
+
 def _load(path: str | pathlib.Path, env: str | None) -> list[ContentAndFormat]:
-    path = pathlib.Path(path) if not isinstance(path, pathlib.Path) else path
+    # plain string operations are used instead of pathlib to avoid constructing path objects for every load
+    path = os.fspath(path)
 
     contents: list[ContentAndFormat] = []
-    with open(path, "rb") as file:
-        contents.append(ContentAndFormat(file.read().strip(), fmt := path.suffix[1:]))
+    contents.append(ContentAndFormat(_read_file(path), fmt := os.path.splitext(path)[1][1:].lower()))
 
     if env is None:
         return contents
 
-    env_file_path = path.parent / helpers.env_file_name(path, env)
-    if env_file_path and env_file_path.is_file():
-        with open(env_file_path, "rb") as file:
-            contents.append(ContentAndFormat(file.read().strip(), fmt))
+    env_file_path = os.path.join(os.path.dirname(path), helpers.env_file_name(path, env))
+    if os.path.isfile(env_file_path):
+        contents.append(ContentAndFormat(_read_file(env_file_path), fmt))
 
     return contents
 
@@ -157,6 +397,29 @@ def _load(path: str | pathlib.Path, env: str | None) -> list[ContentAndFormat]:
 Paths: t.TypeAlias = str | pathlib.Path | Sequence[str | pathlib.Path]
 
 
+def _load_paths(
+    paths: Paths,
+    /,
+    *,
+    cls: type[pydantic.BaseModel | msgspec.Struct] | None,
+    env: str | None,
+    strict: bool,
+    dec_hook: Callable[[type[t.Any], t.Any], t.Any] | None,
+) -> dict[str, t.Any] | pydantic.BaseModel | msgspec.Struct:
+    if isinstance(paths, (str, pathlib.Path)):
+        paths = [paths]
+
+    resolved_env = (env or os.getenv("CONFSPEC_ENV", "")).strip()
+
+    contents: list[ContentAndFormat] = []
+    for path in paths:
+        contents.extend(_load(path, resolved_env or None))
+
+    # expose the resolved environment name to interpolation without modifying the process environment
+    environ = {**os.environ, "CONFSPEC_ENV": resolved_env} if resolved_env else None
+    return _loads(contents, cls=cls, strict=strict, dec_hook=dec_hook, environ=environ)
+
+
 @t.overload
 def load(paths: Paths, /, *, env: str | None = None) -> dict[str, t.Any]: ...
 @t.overload
@@ -195,7 +458,9 @@ def load(
             When provided, an environment-specific file will be looked up using the same base name as the main
             configuration file and the given environment as a suffix (e.g., ``config.prod.yaml`` for ``env="prod"``).
             If not provided, the environment name will be read from the ``CONFSPEC_ENV`` environment variable if set.
-            If neither is specified, only the base configuration file will be loaded.
+            If neither is specified, only the base configuration file will be loaded. The resolved environment name
+            is available to ``${CONFSPEC_ENV}`` expressions in the configuration, but is not set in
+            :obj:`os.environ` - custom parsers, validators and decode hooks cannot read it from there.
         strict: Whether the parsing behaviour of pydantic/msgspec should be in strict mode. Defaults to :obj:`False`.
             If :obj:`True`, then parsers will not perform type coercion (e.g. digit string to int).
         dec_hook: Optional decode hook for msgspec to use when parsing to allow supporting additional types.
@@ -208,14 +473,58 @@ def load(
         :obj:`ValueError`: If the file cannot be parsed to a dictionary (e.g. the top level object is an array).
         :obj:`ImportError`: If a required dependency is not installed.
     """
-    if isinstance(paths, (str, pathlib.Path)):
-        paths = [paths]
+    return _load_paths(paths, cls=cls, env=env, strict=strict, dec_hook=dec_hook)
 
-    resolved_env = (env or os.getenv("CONFSPEC_ENV", "")).strip()
 
-    contents: list[ContentAndFormat] = []
-    for path in paths:
-        contents.extend(_load(path, resolved_env or None))
+@t.overload
+def load_many(
+    paths: Iterable[Paths], /, *, env: str | None = None, max_workers: int | None = None
+) -> list[dict[str, t.Any]]: ...
+@t.overload
+def load_many(
+    paths: Iterable[Paths],
+    /,
+    *,
+    cls: type[StructT],
+    env: str | None = None,
+    strict: bool = False,
+    dec_hook: Callable[[type[t.Any], t.Any], t.Any] | None = None,
+    max_workers: int | None = None,
+) -> list[StructT]: ...
+@t.overload
+def load_many(
+    paths: Iterable[Paths],
+    /,
+    *,
+    cls: type[BaseModelT],
+    env: str | None = None,
+    strict: bool = False,
+    max_workers: int | None = None,
+) -> list[BaseModelT]: ...
+def load_many(
+    paths: Iterable[Paths],
+    /,
+    *,
+    cls: type[pydantic.BaseModel | msgspec.Struct] | None = None,
+    env: str | None = None,
+    strict: bool = False,
+    dec_hook: Callable[[type[t.Any], t.Any], t.Any] | None = None,
+    max_workers: int | None = None,
+) -> list[t.Any]:
+    """
+    Like :meth:`~load`, but loads multiple independent configurations using a thread pool so that the file I/O
+    for each configuration can overlap. Each item in ``paths`` is passed to :meth:`~load` separately, so may itself
+    be a path or a sequence of paths to merge. The results are returned in the same order as the given paths.
+    ``max_workers`` is passed to the :obj:`~concurrent.futures.ThreadPoolExecutor` used. All other arguments have
+    the same meaning as in :meth:`~load`.
+
+    Raises:
+        :obj:`TypeError`: If ``paths`` is a single path instead of an iterable of paths.
+    """
+    # a string is itself an iterable, and would otherwise be loaded one character at a time
+    if isinstance(paths, (str, os.PathLike)):
+        raise TypeError("load_many requires an iterable of paths - use load to load a single configuration")
 
-    with helpers.temp_set_env("CONFSPEC_ENV", resolved_env or None):
-        return _loads(contents, cls=cls, strict=strict, dec_hook=dec_hook)
+    load_one = functools.partial(_load_paths, cls=cls, env=env, strict=strict, dec_hook=dec_hook)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_one, paths))
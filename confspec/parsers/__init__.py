@@ -20,9 +20,10 @@
 # SOFTWARE.
 from __future__ import annotations
 
-__all__ = ["JsonParser", "Parser", "TomlParser", "YamlParser"]
+__all__ = ["CachingYamlParser", "JsonParser", "Parser", "TomlParser", "YamlParser"]
 
 from confspec.parsers.abc import Parser
 from confspec.parsers.json import JsonParser
 from confspec.parsers.toml import TomlParser
+from confspec.parsers.yaml import CachingYamlParser
 from confspec.parsers.yaml import YamlParser
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 __all__ = ["JsonParser"]
 
+import functools
 import typing as t
 
 from confspec.parsers import abc
@@ -30,16 +31,21 @@ if t.TYPE_CHECKING:
     from collections.abc import Callable
 
 
+@functools.cache
+def _reader() -> Callable[[bytes], t.Any]:
+    try:
+        import msgspec
+
+        return msgspec.json.decode
+    except ImportError:
+        import json
+
+        return json.loads
+
+
 class JsonParser(abc.Parser):
     __slots__ = ()
 
     @property
     def reader(self) -> Callable[[bytes], t.Any]:
-        try:
-            import msgspec
-
-            return msgspec.json.decode
-        except ImportError:
-            import json
-
-            return json.loads
+        return _reader()
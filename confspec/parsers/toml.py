@@ -22,6 +22,7 @@ from __future__ import annotations
 
 __all__ = ["TomlParser"]
 
+import functools
 import typing as t
 
 from confspec.parsers import abc
@@ -30,16 +31,21 @@ if t.TYPE_CHECKING:
     from collections.abc import Callable
 
 
+@functools.cache
+def _reader() -> Callable[[bytes], t.Any]:
+    try:
+        import msgspec
+
+        return msgspec.toml.decode
+    except ImportError:
+        import tomllib
+
+        return lambda b: tomllib.loads(b.decode())
+
+
 class TomlParser(abc.Parser):
     __slots__ = ()
 
     @property
     def reader(self) -> Callable[[bytes], t.Any]:
-        try:
-            import msgspec
-
-            return msgspec.toml.decode
-        except ImportError:
-            import tomllib
-
-            return lambda b: tomllib.loads(b.decode())
+        return _reader()
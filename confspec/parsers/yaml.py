@@ -20,8 +20,10 @@
 # SOFTWARE.
 from __future__ import annotations
 
-__all__ = ["YamlParser"]
+__all__ = ["CachingYamlParser", "YamlParser"]
 
+import copy
+import functools
 import typing as t
 
 from confspec.parsers import abc
@@ -29,15 +31,61 @@ from confspec.parsers import abc
 if t.TYPE_CHECKING:
     from collections.abc import Callable
 
+_CACHE_MAX_DOCUMENT_SIZE: t.Final[int] = 64 * 1024
+
+
+def _load(raw: bytes) -> t.Any:
+    try:
+        import ruamel.yaml as yaml
+    except ImportError as e:
+        raise ImportError("ruamel.yaml is required for yaml support") from e
+
+    # uses the C based parser from ruamel.yaml.clib when it is installed, otherwise the pure python parser.
+    # the C parser ignores %YAML directives, so documents that may contain one always use the pure python parser
+    pure = b"%YAML" in raw
+    return yaml.YAML(typ="safe", pure=pure).load(raw)  # type: ignore[reportUnknownMemberType,reportUnknownVariableType]
+
+
+_cached_load = functools.lru_cache(maxsize=32)(_load)
+
 
 class YamlParser(abc.Parser):
     __slots__ = ()
 
     @property
     def reader(self) -> Callable[[bytes], t.Any]:
-        try:
-            import ruamel.yaml as yaml
+        return _load
+
+
+class CachingYamlParser(YamlParser):
+    """
+    YAML parser that caches parsed documents by their content.
+
+    This is useful for applications that repeatedly load the same configuration. It is not used by default -
+    register it in place of :obj:`~YamlParser` to enable it:
+
+    .. code-block:: python
+
+        confspec.parser_registry["yaml"] = confspec.parsers.CachingYamlParser
+        confspec.parser_registry["yml"] = confspec.parsers.CachingYamlParser
+
+    Up to 32 documents are cached, and documents larger than 64KiB are never cached. Note that cached documents
+    are kept in memory until they are evicted or :meth:`~CachingYamlParser.clear_cache` is called.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Remove all documents from the cache."""
+        _cached_load.cache_clear()
+
+    @property
+    def reader(self) -> Callable[[bytes], t.Any]:
+        def read(raw: bytes) -> t.Any:
+            if len(raw) > _CACHE_MAX_DOCUMENT_SIZE:
+                return _load(raw)
+            # the result is later modified in place, so each read must receive its own copy
+            return copy.deepcopy(_cached_load(raw))
 
-            return yaml.YAML(typ="safe", pure=True).load  # type: ignore[reportUnknownMemberType,reportUnknownVariableType]
-        except ImportError as e:
-            raise ImportError("ruamel.yaml is required for yaml support") from e
+        return read
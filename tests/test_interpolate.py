@@ -81,3 +81,51 @@ def test_interpolate_default_none_variable_unset(monkeypatch: pytest.MonkeyPatch
     monkeypatch.delenv("FOO", raising=False)
 
     assert interpolate.try_interpolate("${FOO?}") is None
+
+
+def test_interpolate_no_substitution() -> None:
+    value = "just a plain string"
+
+    assert interpolate.try_interpolate(value) is value
+
+
+def test_visitor_interpolates_nested_containers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOO", "bar")
+    monkeypatch.setenv("BAZ", "a,b")
+
+    visited = interpolate.InterpolationVisitor().visit(
+        {
+            "foo": "${FOO}",
+            "nested": {"baz": "${BAZ[,]}", "items": ["${FOO}", 1, {"deep": "x-${FOO}"}]},
+            "plain": 123,
+        }
+    )
+
+    assert visited == {
+        "foo": "bar",
+        "nested": {"baz": ["a", "b"], "items": ["bar", 1, {"deep": "x-bar"}]},
+        "plain": 123,
+    }
+
+
+def test_interpolate_within_string(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOO", "bar")
+
+    assert interpolate.try_interpolate("a ${FOO} b $${FOO} c $$${FOO}") == "a bar b ${FOO} c $${FOO}"
+
+
+def test_visitor_does_not_share_list_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOO", "a,b")
+
+    visited = interpolate.InterpolationVisitor().visit({"x": "${FOO[,]}", "y": "${FOO[,]}"})
+
+    assert visited == {"x": ["a", "b"], "y": ["a", "b"]}
+    assert visited["x"] is not visited["y"]
+
+
+def test_interpolate_uses_given_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOO", "bar")
+
+    assert interpolate.try_interpolate("${FOO}", {"FOO": "baz"}) == "baz"
+    assert interpolate.try_interpolate("a-${FOO}", {"FOO": "baz"}) == "a-baz"
+    assert interpolate.try_interpolate("${FOO[,]}", {"FOO": "baz,bork"}) == ["baz", "bork"]
@@ -18,7 +18,28 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import codecs
+import dataclasses
+import datetime
+import pathlib
+import typing as t
+
+import msgspec
+import pydantic
+import pytest
+
 from confspec import loader
+from confspec import parsers
+
+
+class Struct(msgspec.Struct):
+    foo: str
+    baz: int
+
+
+class Model(pydantic.BaseModel):
+    foo: str
+    baz: int
 
 
 def test_merge_dicts() -> None:
@@ -60,6 +81,27 @@ def test_loads_json() -> None:
     assert parsed["baz"] == 123
 
 
+def test_loads_json_to_msgspec() -> None:
+    assert loader.loads(JSON_SAMPLE, "json", cls=Struct) == Struct(foo="bar", baz=123)
+
+
+def test_loads_json_to_pydantic() -> None:
+    assert loader.loads(JSON_SAMPLE, "json", cls=Model) == Model(foo="bar", baz=123)
+
+
+def test_loads_coerces_when_not_strict() -> None:
+    assert loader.loads('{"foo": "bar", "baz": "123"}', "json", cls=Struct) == Struct(foo="bar", baz=123)
+    assert loader.loads('{"foo": "bar", "baz": "123"}', "json", cls=Model) == Model(foo="bar", baz=123)
+
+
+def test_loads_does_not_coerce_when_strict() -> None:
+    with pytest.raises(msgspec.ValidationError):
+        loader.loads('{"foo": "bar", "baz": "123"}', "json", cls=Struct, strict=True)
+
+    with pytest.raises(pydantic.ValidationError):
+        loader.loads('{"foo": "bar", "baz": "123"}', "json", cls=Model, strict=True)
+
+
 YAML_SAMPLE = """
 foo: bar
 baz: 123
@@ -113,3 +155,239 @@ def test_load_multiple_files() -> None:
         "bork": {"qux": 123},
         "db": {"host": "localhost", "user": "postgres", "dbname": "postgres", "port": 5432},
     }
+
+
+def test_loads_json_with_escaped_expression(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOO", "bar")
+
+    assert loader.loads('{"foo": "\\u0024{FOO}", "baz": 1}', "json", cls=Struct) == Struct(foo="bar", baz=1)
+    assert loader.loads('{"foo": "\\u0024{FOO}", "baz": 1}', "json", cls=Model) == Model(foo="bar", baz=1)
+
+
+class DatetimeModel(pydantic.BaseModel):
+    at: datetime.datetime
+
+
+def test_loads_toml_datetime_to_pydantic_strict() -> None:
+    parsed = loader.loads("at = 2025-01-01T00:00:00", "toml", cls=DatetimeModel, strict=True)
+
+    assert parsed == DatetimeModel(at=datetime.datetime(2025, 1, 1))
+
+
+def test_loads_yaml_with_escaped_expression(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FOO", "bar")
+
+    assert loader.loads('foo: "\\x24{FOO}"', "yaml") == {"foo": "bar"}
+
+
+def test_load_file_with_uppercase_extension(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "config.TOML"
+    path.write_text('foo = "bar"')
+
+    assert loader.load(path) == {"foo": "bar"}
+
+
+def test_loads_yaml_respects_version_directive() -> None:
+    parsed = loader.loads("%YAML 1.1\n---\na: yes\nb: 010\n", "yaml")
+
+    assert parsed == {"a": True, "b": 8}
+
+
+def test_loads_yaml_with_caching_parser_is_not_affected_by_previous_loads(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(loader.parser_registry, "yaml", parsers.CachingYamlParser)
+    parsers.CachingYamlParser.clear_cache()
+
+    monkeypatch.setenv("FOO", "bar")
+    assert loader.loads("foo: ${FOO}", "yaml") == {"foo": "bar"}
+
+    monkeypatch.setenv("FOO", "baz")
+    assert loader.loads("foo: ${FOO}", "yaml") == {"foo": "baz"}
+
+
+def test_load_many() -> None:
+    parsed = loader.load_many(["tests/resources/config.toml", "tests/resources/config2.toml"])
+
+    assert parsed == [
+        {"foo": "bar", "baz": 123, "bork": {"qux": "quark"}},
+        {"db": {"host": "localhost", "user": "postgres", "dbname": "postgres", "port": 5432}},
+    ]
+
+
+@pytest.mark.parametrize("cls", [Struct, Model])
+def test_load_many_to_class(cls: type[Struct | Model]) -> None:
+    parsed = loader.load_many(["tests/resources/config.toml", "tests/resources/config.toml"], cls=cls)
+
+    assert parsed == [cls(foo="bar", baz=123), cls(foo="bar", baz=123)]
+
+
+@pytest.mark.parametrize("path", ["tests/resources/config.toml", pathlib.Path("tests/resources/config.toml")])
+def test_load_many_rejects_single_path(path: str | pathlib.Path) -> None:
+    with pytest.raises(TypeError):
+        loader.load_many(path)  # type: ignore[reportArgumentType]
+
+
+@pytest.mark.parametrize(
+    ("raw", "fmt"),
+    [
+        ('{"foo": "${FOO}", "bar": "${BAR}", "baz": {"qux": [1, 2]}}', "json"),
+        ("foo: ${FOO}\nbar: ${BAR}\nbaz:\n  qux: [1, 2]", "yaml"),
+    ],
+)
+def test_loads_lazy(monkeypatch: pytest.MonkeyPatch, raw: str, fmt: str) -> None:
+    monkeypatch.setenv("FOO", "foo")
+    monkeypatch.delenv("BAR", raising=False)
+
+    parsed = loader.loads(raw, fmt, lazy=True)
+
+    assert isinstance(parsed, loader.LazyConfig)
+    assert list(parsed) == ["foo", "bar", "baz"]
+    assert parsed["foo"] == "foo"
+    assert parsed["baz"] == {"qux": [1, 2]}
+    # values which are never accessed are never interpolated
+    assert "bar" in parsed
+    assert "missing" not in parsed
+    with pytest.raises(ValueError, match="BAR"):
+        parsed["bar"]
+    with pytest.raises(ValueError, match="BAR"):
+        parsed.get("bar")
+    with pytest.raises(KeyError):
+        parsed["missing"]
+
+
+def test_loads_lazy_false_returns_dict() -> None:
+    lazy = False
+    parsed = loader.loads('{"foo": "bar"}', "json", lazy=lazy)
+
+    assert parsed == {"foo": "bar"}
+    assert not isinstance(parsed, loader.LazyConfig)
+
+
+class StrictConfigModel(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(strict=True)
+
+    at: datetime.datetime
+    foo: str
+
+
+@pytest.mark.parametrize(
+    ("raw", "fmt"),
+    [
+        ('{"at": "2025-01-01T00:00:00", "foo": "bar"}', "json"),
+        ('{"at": "2025-01-01T00:00:00", "foo": "${FOO}"}', "json"),
+        ('at = 2025-01-01T00:00:00\nfoo = "${FOO}"', "toml"),
+    ],
+)
+def test_loads_pydantic_strict_config_when_not_strict(monkeypatch: pytest.MonkeyPatch, raw: str, fmt: str) -> None:
+    monkeypatch.setenv("FOO", "bar")
+
+    parsed = loader.loads(raw, fmt, cls=StrictConfigModel)
+
+    assert parsed == StrictConfigModel(at=datetime.datetime(2025, 1, 1), foo="bar")
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-be"])
+def test_loads_yaml_wide_encoding_is_interpolated(monkeypatch: pytest.MonkeyPatch, encoding: str) -> None:
+    monkeypatch.setenv("FOO", "bar")
+
+    raw = "foo: ${FOO}\n".encode(encoding)
+    if encoding == "utf-16-be":
+        raw = codecs.BOM_UTF16_BE + raw
+
+    assert loader.loads(raw, "yaml") == {"foo": "bar"}
+
+
+class PortsStruct(msgspec.Struct):
+    ports: dict[str, str]
+
+
+class PortsModel(pydantic.BaseModel):
+    ports: dict[str, str]
+
+
+class IntKeysStruct(msgspec.Struct):
+    ports: dict[int, str]
+
+
+@pytest.mark.parametrize("cls", [PortsStruct, PortsModel])
+@pytest.mark.parametrize("strict", [True, False])
+def test_loads_yaml_non_str_keys_to_class(cls: type[PortsStruct | PortsModel], strict: bool) -> None:
+    parsed = loader.loads("ports:\n  80: http\n  443: https", "yaml", cls=cls, strict=strict)
+
+    assert parsed == cls(ports={"80": "http", "443": "https"})
+
+
+@pytest.mark.parametrize(
+    ("raw", "fmt"),
+    [
+        ('[ports]\n1 = "a"', "toml"),
+        ('ports:\n  "1": a', "yaml"),
+        ('{"ports": {"1": "${FOO:a}"}}', "json"),
+    ],
+)
+def test_loads_msgspec_strict_str_keys_to_int_keys(raw: str, fmt: str) -> None:
+    parsed = loader.loads(raw, fmt, cls=IntKeysStruct, strict=True)
+
+    assert parsed == IntKeysStruct(ports={1: "a"})
+
+
+class IntKeysModel(pydantic.BaseModel):
+    ports: dict[int, str]
+
+
+@pytest.mark.parametrize("strict", [True, False])
+@pytest.mark.parametrize(
+    ("raw", "fmt"),
+    [
+        ('[ports]\n1 = "a"', "toml"),
+        ("ports:\n  1: a", "yaml"),
+        ('ports:\n  "1": a', "yaml"),
+        ('{"ports": {"1": "${FOO:a}"}}', "json"),
+    ],
+)
+def test_loads_pydantic_int_keys(raw: str, fmt: str, strict: bool) -> None:
+    parsed = loader.loads(raw, fmt, cls=IntKeysModel, strict=strict)
+
+    assert parsed == IntKeysModel(ports={1: "a"})
+
+
+@dataclasses.dataclass
+class UnhashableDecHook:
+    calls: list[type[t.Any]] = dataclasses.field(default_factory=list[type[t.Any]])
+
+    def __call__(self, type_: type[t.Any], obj: t.Any) -> t.Any:
+        self.calls.append(type_)
+        return type_(obj)
+
+
+class Wrapper:
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Wrapper) and other.value == self.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+class WrapperStruct(msgspec.Struct):
+    foo: Wrapper
+
+
+def test_loads_json_msgspec_with_unhashable_dec_hook() -> None:
+    hook = UnhashableDecHook()
+
+    parsed = loader.loads('{"foo": "bar"}', "json", cls=WrapperStruct, dec_hook=hook)
+
+    assert parsed == WrapperStruct(foo=Wrapper("bar"))
+    assert hook.calls == [Wrapper]
+
+
+@pytest.mark.parametrize(("raw", "fmt"), [('foo = "bar"', "toml"), ('{"foo": "${FOO:bar}"}', "json")])
+def test_loads_msgspec_convert_with_unhashable_dec_hook(raw: str, fmt: str) -> None:
+    hook = UnhashableDecHook()
+
+    parsed = loader.loads(raw, fmt, cls=WrapperStruct, dec_hook=hook)
+
+    assert parsed == WrapperStruct(foo=Wrapper("bar"))
+    assert hook.calls == [Wrapper]